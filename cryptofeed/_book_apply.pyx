@@ -0,0 +1,40 @@
+'''
+Copyright (C) 2017-2023 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+from decimal import Decimal
+
+
+def apply_deltas(object book_bids, object book_asks, list updates_b, list updates_a):
+    """
+    Apply lists of [price, amount] level updates to the bid and ask sides of a book.
+    A zero amount removes the level. Returns the (price, amount) deltas for each side.
+    """
+    cdef list delta_b = []
+    cdef list delta_a = []
+
+    for update in updates_b:
+        price = Decimal(update[0])
+        amount = Decimal(update[1])
+        delta_b.append((price, amount))
+
+        if not amount:
+            if price in book_bids:
+                del book_bids[price]
+        else:
+            book_bids[price] = amount
+
+    for update in updates_a:
+        price = Decimal(update[0])
+        amount = Decimal(update[1])
+        delta_a.append((price, amount))
+
+        if not amount:
+            if price in book_asks:
+                del book_asks[price]
+        else:
+            book_asks[price] = amount
+
+    return delta_b, delta_a
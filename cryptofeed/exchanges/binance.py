@@ -13,8 +13,9 @@ import time
 from typing import Dict, Union, Tuple
 from urllib.parse import urlencode
 
-from yapic import json
+import orjson
 
+from cryptofeed._book_apply import apply_deltas
 from cryptofeed.connection import AsyncConnection, HTTPPoll, HTTPConcurrentPoll, RestEndpoint, Routes, WebsocketEndpoint
 from cryptofeed.defines import ASK, BALANCES, BID, BINANCE, BUY, CANDLES, FUNDING, FUTURES, L2_BOOK, LIMIT, LIQUIDATIONS, MARKET, OPEN_INTEREST, ORDER_INFO, PERPETUAL, SELL, SPOT, TICKER, TRADES, FILLED, UNFILLED
 from cryptofeed.feed import Feed
@@ -29,7 +30,7 @@ LOG = logging.getLogger('feedhandler')
 
 class Binance(Feed, BinanceRestMixin):
     id = BINANCE
-    websocket_endpoints = [WebsocketEndpoint('wss://stream.binance.com:9443', sandbox='wss://testnet.binance.vision')]
+    websocket_endpoints = [WebsocketEndpoint('wss://stream.binance.com:9443', sandbox='wss://testnet.binance.vision', options={'compression': None})]
     rest_endpoints = [RestEndpoint('https://api.binance.com', routes=Routes('/api/v3/exchangeInfo', l2book='/api/v3/depth?symbol={}&limit={}', authentication='/api/v3/userDataStream'), sandbox='https://testnet.binance.vision')]
 
     valid_depths = [5, 10, 20, 50, 100, 500, 1000, 5000]
@@ -74,17 +75,25 @@ class Binance(Feed, BinanceRestMixin):
             info['instrument_type'][s.normalized] = stype
         return ret, info
 
-    def __init__(self, depth_interval='100ms', **kwargs):
+    def __init__(self, depth_interval='100ms', raw_numeric=False, **kwargs):
         """
         depth_interval: str
             time between l2_book/delta updates {'100ms', '1000ms'} (different from BINANCE_FUTURES & BINANCE_DELIVERY)
+        raw_numeric: bool
+            pass the prices, amounts and rates of trades, tickers and funding through as the strings sent by the
+            exchange instead of converting them to Decimal. Book data is always converted. Applies to every
+            Binance subclass (BinanceFutures, BinanceDelivery, BinanceUS, BinanceTR). Not supported when
+            cryptofeed.types is compiled with type check assertions.
         """
         if depth_interval is not None and depth_interval not in self.valid_depth_intervals:
             raise ValueError(f"Depth interval must be one of {self.valid_depth_intervals}")
 
         super().__init__(**kwargs)
         self.depth_interval = depth_interval
+        self.raw_numeric = raw_numeric
         self._open_interest_cache = {}
+        # depth updates and tickers are dispatched separately in message_handler
+        self._dispatch = {'aggTrade': self._trade, 'forceOrder': self._liquidations, 'markPriceUpdate': self._funding, 'kline': self._candle}
         self._reset()
 
     def _address(self) -> Union[str, Dict]:
@@ -168,7 +177,7 @@ class Binance(Feed, BinanceRestMixin):
         else:
             raise ValueError(f'Unable to retrieve listenKey token from {url}')
 
-    async def _trade(self, msg: dict, timestamp: float):
+    async def _trade(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             "e": "aggTrade",  // Event type
@@ -184,17 +193,24 @@ class Binance(Feed, BinanceRestMixin):
             "M": true         // Ignore
         }
         """
+        pair = self.exchange_symbol_to_std_symbol(msg['s'])
+        if self.raw_numeric:
+            amount = msg['q']
+            price = msg['p']
+        else:
+            amount = _D(msg['q'])
+            price = _D(msg['p'])
         t = Trade(self.id,
-                  self.exchange_symbol_to_std_symbol(msg['s']),
+                  pair,
                   SELL if msg['m'] else BUY,
-                  Decimal(msg['q']),
-                  Decimal(msg['p']),
-                  self.timestamp_normalize(msg['T']),
+                  amount,
+                  price,
+                  msg['T'] / 1000.0,
                   id=str(msg['a']),
                   raw=msg)
         await self.callback(TRADES, t, timestamp)
 
-    async def _ticker(self, msg: dict, timestamp: float):
+    async def _ticker(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             'u': 382569232,
@@ -206,19 +222,23 @@ class Binance(Feed, BinanceRestMixin):
         }
         """
         pair = self.exchange_symbol_to_std_symbol(msg['s'])
-        bid = Decimal(msg['b'])
-        ask = Decimal(msg['a'])
+        if self.raw_numeric:
+            bid = msg['b']
+            ask = msg['a']
+        else:
+            bid = _D(msg['b'])
+            ask = _D(msg['a'])
 
         # Binance does not have a timestamp in this update, but the two futures APIs do
         if 'E' in msg:
-            ts = self.timestamp_normalize(msg['E'])
+            ts = msg['E'] / 1000.0
         else:
             ts = timestamp
 
         t = Ticker(self.id, pair, bid, ask, ts, raw=msg)
         await self.callback(TICKER, t, timestamp)
 
-    async def _liquidations(self, msg: dict, timestamp: float):
+    async def _liquidations(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
         "e":"forceOrder",       // Event Type
@@ -242,11 +262,11 @@ class Binance(Feed, BinanceRestMixin):
         liq = Liquidation(self.id,
                           pair,
                           SELL if msg['o']['S'] == 'SELL' else BUY,
-                          Decimal(msg['o']['q']),
-                          Decimal(msg['o']['p']),
+                          _D(msg['o']['q']),
+                          _D(msg['o']['p']),
                           None,
                           FILLED if msg['o']['X'] == 'FILLED' else UNFILLED,
-                          self.timestamp_normalize(msg['E']),
+                          msg['E'] / 1000.0,
                           raw=msg)
         await self.callback(LIQUIDATIONS, liq, receipt_timestamp=timestamp)
 
@@ -280,12 +300,14 @@ class Binance(Feed, BinanceRestMixin):
                     break
 
         resp = await self.http_conn.read(self.rest_endpoints[0].route('l2book', self.sandbox).format(pair, max_depth))
-        resp = json.loads(resp, parse_float=Decimal)
+        resp = orjson.loads(resp)
         timestamp = self.timestamp_normalize(resp['E']) if 'E' in resp else None
 
         std_pair = self.exchange_symbol_to_std_symbol(pair)
         self.last_update_id[std_pair] = resp['lastUpdateId']
-        self._l2_book[std_pair] = OrderBook(self.id, std_pair, max_depth=self.max_depth, bids={Decimal(u[0]): Decimal(u[1]) for u in resp['bids']}, asks={Decimal(u[0]): Decimal(u[1]) for u in resp['asks']})
+        bids = {Decimal(price): Decimal(amount) for price, amount in resp['bids']}
+        asks = {Decimal(price): Decimal(amount) for price, amount in resp['asks']}
+        self._l2_book[std_pair] = OrderBook(self.id, std_pair, max_depth=self.max_depth, bids=bids, asks=asks)
         await self.book_callback(L2_BOOK, self._l2_book[std_pair], time.time(), timestamp=timestamp, raw=resp, sequence_number=self.last_update_id[std_pair])
 
     async def _book(self, msg: dict, pair: str, timestamp: float):
@@ -311,7 +333,7 @@ class Binance(Feed, BinanceRestMixin):
         }
         """
         exchange_pair = pair
-        pair = self.exchange_symbol_to_std_symbol(pair)
+        pair = self.exchange_symbol_to_std_symbol(exchange_pair)
 
         if pair not in self._l2_book:
             await self._snapshot(exchange_pair)
@@ -320,23 +342,13 @@ class Binance(Feed, BinanceRestMixin):
         if skip_update:
             return
 
-        delta = {BID: [], ASK: []}
+        book = self._l2_book[pair].book
+        bids, asks = apply_deltas(book[BID], book[ASK], msg['b'], msg['a'])
+        delta = {BID: bids, ASK: asks}
 
-        for s, side in (('b', BID), ('a', ASK)):
-            for update in msg[s]:
-                price = Decimal(update[0])
-                amount = Decimal(update[1])
-                delta[side].append((price, amount))
-
-                if amount == 0:
-                    if price in self._l2_book[pair].book[side]:
-                        del self._l2_book[pair].book[side][price]
-                else:
-                    self._l2_book[pair].book[side][price] = amount
+        await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, timestamp=msg['E'] / 1000.0, raw=msg, delta=delta, sequence_number=self.last_update_id[pair])
 
-        await self.book_callback(L2_BOOK, self._l2_book[pair], timestamp, timestamp=self.timestamp_normalize(msg['E']), raw=msg, delta=delta, sequence_number=self.last_update_id[pair])
-
-    async def _funding(self, msg: dict, timestamp: float):
+    async def _funding(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             "e": "markPriceUpdate",  // Event type
@@ -359,22 +371,30 @@ class Binance(Feed, BinanceRestMixin):
             "T": 1562306400000          // Next funding time
         }
         """
-        next_time = self.timestamp_normalize(msg['T']) if msg['T'] > 0 else None
-        rate = Decimal(msg['r']) if msg['r'] else None
+        next_time = msg['T'] / 1000.0 if msg['T'] > 0 else None
+        predicted_rate = msg['P'] if 'P' in msg else None
+        if self.raw_numeric:
+            mark_price = msg['p']
+            rate = msg['r'] or None
+        else:
+            mark_price = _D(msg['p'])
+            rate = _D(msg['r']) if msg['r'] else None
+            predicted_rate = _D(predicted_rate) if predicted_rate is not None else None
         if next_time is None:
             rate = None
 
+        pair = self.exchange_symbol_to_std_symbol(msg['s'])
         f = Funding(self.id,
-                    self.exchange_symbol_to_std_symbol(msg['s']),
-                    Decimal(msg['p']),
+                    pair,
+                    mark_price,
                     rate,
                     next_time,
-                    self.timestamp_normalize(msg['E']),
-                    predicted_rate=Decimal(msg['P']) if 'P' in msg and msg['P'] is not None else None,
+                    msg['E'] / 1000.0,
+                    predicted_rate=predicted_rate,
                     raw=msg)
         await self.callback(FUNDING, f, timestamp)
 
-    async def _candle(self, msg: dict, timestamp: float):
+    async def _candle(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             'e': 'kline',
@@ -409,13 +429,13 @@ class Binance(Feed, BinanceRestMixin):
                    msg['k']['T'] / 1000,
                    msg['k']['i'],
                    msg['k']['n'],
-                   Decimal(msg['k']['o']),
-                   Decimal(msg['k']['c']),
-                   Decimal(msg['k']['h']),
-                   Decimal(msg['k']['l']),
-                   Decimal(msg['k']['v']),
+                   _D(msg['k']['o']),
+                   _D(msg['k']['c']),
+                   _D(msg['k']['h']),
+                   _D(msg['k']['l']),
+                   _D(msg['k']['v']),
                    msg['k']['x'],
-                   self.timestamp_normalize(msg['E']),
+                   msg['E'] / 1000.0,
                    raw=msg)
         await self.callback(CANDLES, c, timestamp)
 
@@ -496,38 +516,42 @@ class Binance(Feed, BinanceRestMixin):
         await self.callback(ORDER_INFO, oi, timestamp)
 
     async def message_handler(self, msg: str, conn, timestamp: float):
-        msg = json.loads(msg, parse_float=Decimal)
-
         # Handle account updates from User Data Stream
         if self.requires_authentication:
+            msg = orjson.loads(msg)
             msg_type = msg['e']
             if msg_type == 'outboundAccountPosition':
                 await self._account_update(msg, timestamp)
             elif msg_type == 'executionReport':
                 await self._order_update(msg, timestamp)
             return
+
+        # The event type is read from the raw frame so that the frame is only
+        # decoded once we know it will be handled. Ticker (bookTicker) payloads
+        # are the only ones without an event type.
+        start = msg.find('"e":"') + 5
+        if start > 4:
+            event = msg[start:msg.index('"', start)]
+            if event != 'depthUpdate' and event not in self._dispatch:
+                LOG.warning("%s: Unexpected message received: %s", self.id, msg)
+                return
+        elif '"A":' in msg:
+            event = None
+        else:
+            LOG.warning("%s: Unexpected message received: %s", self.id, msg)
+            return
+
+        msg = orjson.loads(msg)
         # Combined stream events are wrapped as follows: {"stream":"<streamName>","data":<rawPayload>}
         # streamName is of format <symbol>@<channel>
         pair, _ = msg['stream'].split('@', 1)
         msg = msg['data']
-        pair = pair.upper()
-        if 'e' in msg:
-            if msg['e'] == 'depthUpdate':
-                await self._book(msg, pair, timestamp)
-            elif msg['e'] == 'aggTrade':
-                await self._trade(msg, timestamp)
-            elif msg['e'] == 'forceOrder':
-                await self._liquidations(msg, timestamp)
-            elif msg['e'] == 'markPriceUpdate':
-                await self._funding(msg, timestamp)
-            elif msg['e'] == 'kline':
-                await self._candle(msg, timestamp)
-            else:
-                LOG.warning("%s: Unexpected message received: %s", self.id, msg)
-        elif 'A' in msg:
+        if event == 'depthUpdate':
+            await self._book(msg, pair.upper(), timestamp)
+        elif event is None:
             await self._ticker(msg, timestamp)
         else:
-            LOG.warning("%s: Unexpected message received: %s", self.id, msg)
+            await self._dispatch[event](msg, timestamp)
 
     async def subscribe(self, conn: AsyncConnection):
         # Binance does not have a separate subscribe message, the
@@ -4,7 +4,6 @@ Copyright (C) 2017-2023 Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
-from collections import defaultdict
 import logging
 from decimal import Decimal
 import time
@@ -52,7 +51,7 @@ class Gateio(Feed):
     def _reset(self):
         self._l2_book = {}
         self.last_update_id = {}
-        self.forced = defaultdict(bool)
+        self.forced = set()
 
     async def _ticker(self, msg: dict, timestamp: float):
         """
@@ -132,13 +131,13 @@ class Gateio(Feed):
 
     def _check_update_id(self, pair: str, msg: dict) -> Tuple[bool, bool]:
         skip_update = False
-        forced = not self.forced[pair]
+        forced = pair not in self.forced
 
         if forced and msg['u'] <= self.last_update_id[pair]:
             skip_update = True
         elif forced and msg['U'] <= self.last_update_id[pair] + 1 <= msg['u']:
             self.last_update_id[pair] = msg['u']
-            self.forced[pair] = True
+            self.forced.add(pair)
         elif not forced and self.last_update_id[pair] + 1 == msg['U']:
             self.last_update_id[pair] = msg['u']
         else:
@@ -10,7 +10,7 @@ from uuid import uuid4
 from decimal import Decimal
 from typing import Dict, Tuple
 
-from yapic import json
+import orjson
 
 from cryptofeed.connection import AsyncConnection, RestEndpoint, Routes, WebsocketEndpoint
 from cryptofeed.defines import BID, ASK, BUY, L2_BOOK, POLONIEX_FUTURES, SELL, TRADES, PERPETUAL
@@ -22,11 +22,13 @@ from cryptofeed.types import OrderBook, Trade
 
 LOG = logging.getLogger('feedhandler')
 
+SUBSCRIBE_MSG = '{"id":%d,"type":"subscribe","topic":"/contractMarket/%s:%s","privateChannel":false,"response":true}'
+
 
 class PoloniexFutures(Poloniex):
     id = POLONIEX_FUTURES
     websocket_endpoints = [
-        WebsocketEndpoint('wss://futures-apiws.poloniex.com/')
+        WebsocketEndpoint('wss://futures-apiws.poloniex.com/', options={'compression': None})
     ]
     rest_endpoints = [
         RestEndpoint(
@@ -56,6 +58,10 @@ class PoloniexFutures(Poloniex):
             info['instrument_type'][s.normalized] = s.type
         return ret, info
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._dispatch = {'match': self._trade, 'level2': self._book}
+
     def __reset(self):
         self._l2_book = {}
         self.seq_no = {}
@@ -65,7 +71,7 @@ class PoloniexFutures(Poloniex):
 
         data = self.http_sync.write(self.rest_endpoints[0].route(
             'authentication', sandbox=self.sandbox))
-        data = json.loads(data)
+        data = orjson.loads(data)
         token = data['data']
 
         params = {
@@ -81,7 +87,7 @@ class PoloniexFutures(Poloniex):
 
         return [url]
 
-    async def _trade(self, msg: dict, timestamp: float):
+    async def _trade(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             'data': {
@@ -102,17 +108,19 @@ class PoloniexFutures(Poloniex):
             'type': 'message'
         }
         """
-        price = Decimal(msg['data']['price'])
-        amount = Decimal(msg['data']['size'])
+        price = _D(str(msg['data']['price']))
+        amount = _D(str(msg['data']['size']))
         # timestamp is in nanoseconds
         trade_timestamp = self.timestamp_normalize(
             msg['data']['ts']) / 1_000_000
-        t = Trade(msg['data']['tradeId'],
-                  self.exchange_symbol_to_std_symbol(msg['data']['symbol']),
+        symbol = self.exchange_symbol_to_std_symbol(msg['data']['symbol'])
+        t = Trade(self.id,
+                  symbol,
                   SELL if msg['data']['side'] == 'sell' else BUY,
                   amount,
                   price,
                   trade_timestamp,
+                  id=msg['data']['tradeId'],
                   raw=msg)
         await self.callback(TRADES, t, timestamp)
 
@@ -125,16 +133,16 @@ class PoloniexFutures(Poloniex):
                 'EGLDUSDTPERP',
                 'sequence':
                 1666242556001,
-                'asks': [[Decimal('55.6'), 157], [Decimal('55.61'), 150],
-                         [Decimal('55.63'), 400], [Decimal('55.65'), 407],
-                         [Decimal('55.66'), 237], [Decimal('55.82'), 2561],
-                         [Decimal('55.92'), 815], [Decimal('56.03'), 607],
-                         [Decimal('56.36'), 184], [Decimal('56.43'), 190]],
-                'bids': [[Decimal('55.51'), 150], [Decimal('55.5'), 90],
-                         [Decimal('55.48'), 100], [Decimal('55.46'), 157],
-                         [Decimal('55.45'), 300], [Decimal('55.41'), 407],
-                         [Decimal('55.4'), 237], [Decimal('55.27'), 1629],
-                         [Decimal('55.14'), 1022], [Decimal('55.07'), 796]],
+                'asks': [[55.6, 157], [55.61, 150],
+                         [55.63, 400], [55.65, 407],
+                         [55.66, 237], [55.82, 2561],
+                         [55.92, 815], [56.03, 607],
+                         [56.36, 184], [56.43, 190]],
+                'bids': [[55.51, 150], [55.5, 90],
+                         [55.48, 100], [55.46, 157],
+                         [55.45, 300], [55.41, 407],
+                         [55.4, 237], [55.27, 1629],
+                         [55.14, 1022], [55.07, 796]],
                 'ts':
                 1666546818854988483
             }
@@ -142,7 +150,7 @@ class PoloniexFutures(Poloniex):
         """
         ret = await self.http_conn.read(self.rest_endpoints[0].route(
             'l2book', self.sandbox).format(symbol, self.max_depth))
-        res = json.loads(ret, parse_float=Decimal)
+        res = orjson.loads(ret)
         data = res['data']
 
         symbol = self.exchange_symbol_to_std_symbol(symbol)
@@ -151,11 +159,11 @@ class PoloniexFutures(Poloniex):
                                           max_depth=self.max_depth)
         self.seq_no[symbol] = data['sequence']
         self._l2_book[symbol].book.bids = {
-            Decimal(price): Decimal(amount)
+            Decimal(str(price)): Decimal(str(amount))
             for price, amount in data['bids']
         }
         self._l2_book[symbol].book.asks = {
-            Decimal(price): Decimal(amount)
+            Decimal(str(price)): Decimal(str(amount))
             for price, amount in data['asks']
         }
         await self.book_callback(L2_BOOK,
@@ -177,7 +185,7 @@ class PoloniexFutures(Poloniex):
                         self.id)
             return True
 
-    async def _book(self, msg: dict, timestamp: float):
+    async def _book(self, msg: dict, timestamp: float, _D=Decimal):
         """
         {
             'data': {
@@ -203,10 +211,13 @@ class PoloniexFutures(Poloniex):
         ts = self.timestamp_normalize(data['timestamp'])
         delta = {BID: [], ASK: []}
 
-        price, side, amount = data['change'].split(',')
-        price = Decimal(price)
-        amount = Decimal(amount)
-        side = BID if side == 'buy' else ASK
+        # change is formatted as <price>,<side>,<amount>
+        change = data['change']
+        i = change.index(',')
+        j = change.index(',', i + 1)
+        price = _D(change[:i])
+        amount = _D(change[j + 1:])
+        side = BID if change[i + 1] == 'b' else ASK
 
         if amount == 0:
             if price in self._l2_book[symbol].book[side]:
@@ -224,36 +235,26 @@ class PoloniexFutures(Poloniex):
                                  sequence_number=data['sequence'])
 
     async def message_handler(self, msg: str, conn, timestamp: float):
-        msg = json.loads(msg, parse_float=Decimal)
+        msg = orjson.loads(msg)
 
         event = msg.get('type')
         if event == 'error':
             LOG.error("%s: Error from exchange: %s", self.id, msg)
             return
-        elif event == 'welcome':
-            return
-        elif event == 'ack':
-            return
-        elif event == 'subscribe':
+        elif event in ('welcome', 'ack', 'subscribe'):
             return
 
-        channel = msg.get('subject')
-        if channel == 'match':
-            await self._trade(msg, timestamp)
-        elif channel == 'level2':
-            await self._book(msg, timestamp)
-        else:
+        handler = self._dispatch.get(msg.get('subject'))
+        if handler is None:
             LOG.warning('%s: Invalid message type %s', self.id, msg)
+        else:
+            await handler(msg, timestamp)
 
     async def subscribe(self, conn: AsyncConnection):
         self.__reset()
+        # ids only need to be unique per connection, so they are derived from a single timestamp
+        msg_id = int(time.time() * 1000)
         for chan, symbols in self.subscription.items():
             for sym in symbols:
-                d = {
-                    'id': int(time.time() * 1000),
-                    'type': 'subscribe',
-                    'topic': f'/contractMarket/{chan}:{sym}',
-                    'privateChannel': False,
-                    'response': True
-                }
-                await conn.write(json.dumps(d))
+                await conn.write(SUBSCRIBE_MSG % (msg_id, chan, sym))
+                msg_id += 1
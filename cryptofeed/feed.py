@@ -6,6 +6,7 @@ associated with this software.
 '''
 import asyncio
 from collections import defaultdict
+from dataclasses import dataclass
 import logging
 from typing import Tuple, Callable, List, Union
 
@@ -14,7 +15,7 @@ from aiohttp.typedefs import StrOrURL
 from cryptofeed.callback import Callback
 from cryptofeed.connection import AsyncConnection, HTTPAsyncConn, WSAsyncConn
 from cryptofeed.connection_handler import ConnectionHandler
-from cryptofeed.defines import BALANCES, CANDLES, FUNDING, INDEX, L2_BOOK, L3_BOOK, LIQUIDATIONS, OPEN_INTEREST, ORDER_INFO, POSITIONS, TICKER, TRADES, FILLS
+from cryptofeed.defines import ASK, BALANCES, BID, CANDLES, FUNDING, INDEX, L2_BOOK, L3_BOOK, LIQUIDATIONS, OPEN_INTEREST, ORDER_INFO, POSITIONS, TICKER, TRADES, FILLS
 from cryptofeed.exceptions import BidAskOverlapping
 from cryptofeed.exchange import Exchange
 from cryptofeed.types import OrderBook
@@ -23,8 +24,23 @@ from cryptofeed.types import OrderBook
 LOG = logging.getLogger('feedhandler')
 
 
+@dataclass
+class PendingBookUpdate:
+    """
+    L2 book deltas accumulated for a symbol while book_flush_interval is set, along with the
+    metadata of the most recent message
+    """
+    book: OrderBook
+    receipt_timestamp: float
+    timestamp: float
+    raw: object
+    sequence_number: object
+    checksum: object
+    delta: dict
+
+
 class Feed(Exchange):
-    def __init__(self, candle_interval='1m', candle_closed_only=True, timeout=120, timeout_interval=30, retries=10, symbols=None, channels=None, subscription=None, callbacks=None, max_depth=0, checksum_validation=False, cross_check=False, exceptions=None, log_message_on_error=False, delay_start=0, http_proxy: StrOrURL = None, **kwargs):
+    def __init__(self, candle_interval='1m', candle_closed_only=True, timeout=120, timeout_interval=30, retries=10, symbols=None, channels=None, subscription=None, callbacks=None, max_depth=0, checksum_validation=False, cross_check=False, exceptions=None, log_message_on_error=False, delay_start=0, http_proxy: StrOrURL = None, book_flush_interval=0, **kwargs):
         """
         candle_interval: str
             the candle interval. See the specific exchange to see what intervals they support
@@ -59,6 +75,9 @@ class Feed(Exchange):
             on a single exchange, you may encounter 429s. You can use this to stagger the starts.
         http_proxy: str
             URL of proxy server. Passed to HTTPPoll and HTTPAsyncConn. Only used for HTTP GET requests.
+        book_flush_interval: float
+            Time, in seconds, during which L2 book deltas are accumulated per symbol and delivered as a single book update.
+            0 is the default, and delivers every update as it arrives. Snapshots are always delivered immediately.
         """
         super().__init__(**kwargs)
         self.log_on_error = log_message_on_error
@@ -81,6 +100,9 @@ class Feed(Exchange):
         self.candle_interval = candle_interval
         self.candle_closed_only = candle_closed_only
         self._sequence_no = {}
+        self.book_flush_interval = book_flush_interval
+        self._pending_book = {}
+        self._book_flush_task = None
 
         if self.valid_candle_intervals != NotImplemented:
             if candle_interval not in self.valid_candle_intervals:
@@ -239,6 +261,25 @@ class Feed(Exchange):
         if self.cross_check:
             self.check_bid_ask_overlapping(book)
 
+        if self.book_flush_interval and book_type == L2_BOOK:
+            if delta is None:
+                # a snapshot supersedes any deltas accumulated for this symbol
+                self._pending_book.pop(book.symbol, None)
+            else:
+                pending = self._pending_book.get(book.symbol)
+                if pending is None:
+                    self._pending_book[book.symbol] = PendingBookUpdate(book, receipt_timestamp, timestamp, raw, sequence_number, checksum, {BID: dict(delta[BID]), ASK: dict(delta[ASK])})
+                else:
+                    pending.book = book
+                    pending.receipt_timestamp = receipt_timestamp
+                    pending.timestamp = timestamp
+                    pending.raw = raw
+                    pending.sequence_number = sequence_number
+                    pending.checksum = checksum
+                    pending.delta[BID].update(delta[BID])
+                    pending.delta[ASK].update(delta[ASK])
+                return
+
         book.timestamp = timestamp
         book.raw = raw
         book.sequence_number = sequence_number
@@ -246,6 +287,33 @@ class Feed(Exchange):
         book.checksum = checksum
         await self.callback(book_type, book, receipt_timestamp)
 
+    async def _flush_books(self):
+        """
+        Deliver the L2 book deltas accumulated since the last flush, one update per symbol.
+        The most recent message's timestamps, raw data, sequence number and checksum are used.
+        """
+        # entries are popped one at a time so that updates not yet delivered when the
+        # flusher is cancelled are still pending for shutdown
+        for symbol in list(self._pending_book):
+            update = self._pending_book.pop(symbol, None)
+            if update is None:
+                continue
+            book = update.book
+            book.timestamp = update.timestamp
+            book.raw = update.raw
+            book.sequence_number = update.sequence_number
+            book.delta = {BID: list(update.delta[BID].items()), ASK: list(update.delta[ASK].items())}
+            book.checksum = update.checksum
+            try:
+                await self.callback(L2_BOOK, book, update.receipt_timestamp)
+            except Exception:
+                LOG.error("%s: error delivering batched book update for %s", self.id, book.symbol, exc_info=True)
+
+    async def _book_flusher(self):
+        while True:
+            await asyncio.sleep(self.book_flush_interval)
+            await self._flush_books()
+
     def check_bid_ask_overlapping(self, data):
         bid, ask = data.book.bids, data.book.asks
         if len(bid) > 0 and len(ask) > 0:
@@ -270,6 +338,12 @@ class Feed(Exchange):
         LOG.info('%s: feed shutdown starting...', self.id)
         await self.http_conn.close()
 
+        if self._book_flush_task is not None:
+            self._book_flush_task.cancel()
+            self._book_flush_task = None
+        if self._pending_book:
+            await self._flush_books()
+
         for callbacks in self.callbacks.values():
             for callback in callbacks:
                 if hasattr(callback, 'stop'):
@@ -282,6 +356,9 @@ class Feed(Exchange):
     def stop(self):
         for c in self.connection_handlers:
             c.running = False
+        if self._book_flush_task is not None:
+            self._book_flush_task.cancel()
+            self._book_flush_task = None
 
     def start(self, loop: asyncio.AbstractEventLoop):
         """
@@ -291,6 +368,9 @@ class Feed(Exchange):
             self.connection_handlers.append(ConnectionHandler(conn, sub, handler, auth, self.retries, timeout=self.timeout, timeout_interval=self.timeout_interval, exceptions=self.exceptions, log_on_error=self.log_on_error, start_delay=self.start_delay))
             self.connection_handlers[-1].start(loop)
 
+        if self.book_flush_interval:
+            self._book_flush_task = loop.create_task(self._book_flusher())
+
         for callbacks in self.callbacks.values():
             for callback in callbacks:
                 if hasattr(callback, 'start'):
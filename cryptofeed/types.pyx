@@ -86,6 +86,7 @@ cdef class Trade:
         return hash(self.__repr__())
 
 
+@cython.freelist(128)
 cdef class Ticker:
     cdef readonly str exchange
     cdef readonly str symbol
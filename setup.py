@@ -42,10 +42,12 @@ define_macros.append(('CYTHON_WITHOUT_ASSERTIONS', None))
 extension = Extension("cryptofeed.types", ["cryptofeed/types.pyx"],
                       extra_compile_args=extra_compile_args,
                       define_macros=define_macros)
+book_apply_extension = Extension("cryptofeed._book_apply", ["cryptofeed/_book_apply.pyx"],
+                                 extra_compile_args=extra_compile_args)
 
 setup(
     name="cryptofeed",
-    ext_modules=cythonize([extension], language_level=3, force=True),
+    ext_modules=cythonize([extension, book_apply_extension], language_level=3, force=True),
     version="2.4.0",
     author="Bryant Moscon",
     author_email="bmoscon@gmail.com",
@@ -80,6 +82,7 @@ setup(
         "aiohttp==3.8.5",
         "aiofile>=2.0.0",
         "yapic.json>=1.6.3",
+        "orjson>=3.6.0",
         'uvloop ; platform_system!="Windows"',
         "order_book>=0.6.0",
         "aiodns>=1.1"  # aiodns speeds up DNS resolving
@@ -4,11 +4,15 @@ Copyright (C) 2017-2023 Bryant Moscon - bmoscon@gmail.com
 Please see the LICENSE file for the terms and conditions
 associated with this software.
 '''
+import asyncio
 import random
 
 import pytest
 
-from cryptofeed.exchanges import Binance
+from cryptofeed.defines import BINANCE, BINANCE_FUTURES, FUNDING, TICKER, TRADES
+from cryptofeed.exchanges import Binance, BinanceFutures
+from cryptofeed.symbols import Symbols
+from cryptofeed.types import COMPILED_WITH_ASSERTIONS
 
 
 @pytest.mark.xfail(reason="Binance blocks build machine IP ranges. If not in the USA this should pass")
@@ -43,3 +47,34 @@ def test_binance_address_generation():
         assert len(chans) == len(channels) * length == len(syms)
         assert len(set(chans)) == len(channels)
         assert (len(set(syms))) == length
+
+
+@pytest.mark.skipif(COMPILED_WITH_ASSERTIONS, reason="cython assertions enabled")
+def test_binance_raw_numeric():
+    Symbols.set(BINANCE, {'BTC-USDT': 'BTCUSDT'}, {})
+    Symbols.set(BINANCE_FUTURES, {'BTC-USDT-PERP': 'BTCUSDT'}, {})
+    received = {}
+
+    async def cb(obj, receipt_timestamp):
+        received[type(obj).__name__] = obj
+
+    callbacks = {TRADES: cb, TICKER: cb, FUNDING: cb}
+    spot = Binance(symbols=['BTC-USDT'], channels=[TRADES, TICKER], callbacks=callbacks, raw_numeric=True)
+    futures = BinanceFutures(symbols=['BTC-USDT-PERP'], channels=[FUNDING], callbacks=callbacks, raw_numeric=True)
+
+    async def run():
+        await spot.message_handler('{"stream":"btcusdt@aggTrade","data":{"e":"aggTrade","E":1562305380000,"s":"BTCUSDT","a":12345,"p":"0.001","q":"100","f":100,"l":105,"T":1562305380000,"m":true,"M":true}}', None, 1.0)
+        await spot.message_handler('{"stream":"btcusdt@bookTicker","data":{"u":382569232,"s":"BTCUSDT","b":"0.36031000","B":"1500.00000000","a":"0.36092000","A":"176.40000000"}}', None, 1.0)
+        await futures.message_handler('{"stream":"btcusdt@markPrice","data":{"e":"markPriceUpdate","E":1562305380000,"s":"BTCUSDT","p":"11185.87786614","P":"11784.25641265","r":"0.00030000","T":1562306400000}}', None, 1.0)
+
+    try:
+        asyncio.run(run())
+    finally:
+        Symbols.clear()
+
+    trade = received['Trade']
+    assert (trade.symbol, trade.price, trade.amount, trade.id) == ('BTC-USDT', '0.001', '100', '12345')
+    ticker = received['Ticker']
+    assert (ticker.symbol, ticker.bid, ticker.ask, ticker.timestamp) == ('BTC-USDT', '0.36031000', '0.36092000', 1.0)
+    funding = received['Funding']
+    assert (funding.symbol, funding.mark_price, funding.rate, funding.predicted_rate, funding.next_funding_time) == ('BTC-USDT-PERP', '11185.87786614', '0.00030000', '11784.25641265', 1562306400.0)
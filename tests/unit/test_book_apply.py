@@ -0,0 +1,45 @@
+'''
+Copyright (C) 2017-2023 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+from decimal import Decimal
+
+from cryptofeed._book_apply import apply_deltas
+
+
+def test_apply_deltas():
+    bids = {Decimal('1.0'): Decimal('1'), Decimal('0.9'): Decimal('0.5')}
+    asks = {Decimal('1.1'): Decimal('1.1')}
+
+    delta_b, delta_a = apply_deltas(bids, asks, [['1.0', '0'], ['0.8', '2']], [['1.1', '0.5'], ['1.3', '0']])
+
+    assert delta_b == [(Decimal('1.0'), Decimal('0')), (Decimal('0.8'), Decimal('2'))]
+    assert delta_a == [(Decimal('1.1'), Decimal('0.5')), (Decimal('1.3'), Decimal('0'))]
+    assert bids == {Decimal('0.9'): Decimal('0.5'), Decimal('0.8'): Decimal('2')}
+    assert asks == {Decimal('1.1'): Decimal('0.5')}
+
+
+def test_apply_deltas_empty_bids():
+    bids = {Decimal('1.0'): Decimal('1')}
+    asks = {Decimal('1.1'): Decimal('1.1')}
+
+    delta_b, delta_a = apply_deltas(bids, asks, [], [['1.1', '0'], ['1.2', '3']])
+
+    assert delta_b == []
+    assert delta_a == [(Decimal('1.1'), Decimal('0')), (Decimal('1.2'), Decimal('3'))]
+    assert bids == {Decimal('1.0'): Decimal('1')}
+    assert asks == {Decimal('1.2'): Decimal('3')}
+
+
+def test_apply_deltas_empty_asks():
+    bids = {Decimal('1.0'): Decimal('1')}
+    asks = {Decimal('1.1'): Decimal('1.1')}
+
+    delta_b, delta_a = apply_deltas(bids, asks, [['1.0', '2'], ['0.9', '0']], [])
+
+    assert delta_b == [(Decimal('1.0'), Decimal('2')), (Decimal('0.9'), Decimal('0'))]
+    assert delta_a == []
+    assert bids == {Decimal('1.0'): Decimal('2')}
+    assert asks == {Decimal('1.1'): Decimal('1.1')}
@@ -0,0 +1,123 @@
+'''
+Copyright (C) 2017-2023 Bryant Moscon - bmoscon@gmail.com
+
+Please see the LICENSE file for the terms and conditions
+associated with this software.
+'''
+import asyncio
+from decimal import Decimal
+
+import pytest
+
+from cryptofeed.defines import ASK, BID, BINANCE, L2_BOOK
+from cryptofeed.exchanges import Binance
+from cryptofeed.symbols import Symbols
+from cryptofeed.types import OrderBook
+
+
+@pytest.fixture
+def feed():
+    Symbols.set(BINANCE, {'BTC-USDT': 'BTCUSDT', 'ETH-USDT': 'ETHUSDT'}, {})
+    updates = []
+
+    async def book(book, receipt_timestamp):
+        updates.append((book.symbol, book.delta, book.sequence_number, receipt_timestamp))
+
+    f = Binance(symbols=['BTC-USDT', 'ETH-USDT'], channels=[L2_BOOK], callbacks={L2_BOOK: book}, book_flush_interval=1)
+    f.updates = updates
+    yield f
+    Symbols.clear()
+
+
+def delta(bids=(), asks=()):
+    return {BID: [(Decimal(p), Decimal(a)) for p, a in bids], ASK: [(Decimal(p), Decimal(a)) for p, a in asks]}
+
+
+def test_book_flush_merges_deltas(feed):
+    async def run():
+        book = OrderBook(BINANCE, 'BTC-USDT')
+        await feed.book_callback(L2_BOOK, book, 1.0, delta=delta(bids=[('100', '1')], asks=[('101', '2')]), sequence_number=1)
+        await feed.book_callback(L2_BOOK, book, 2.0, delta=delta(bids=[('100', '0'), ('99', '3')]), sequence_number=2)
+        assert feed.updates == []
+        await feed._flush_books()
+
+    asyncio.run(run())
+    assert feed.updates == [('BTC-USDT', delta(bids=[('100', '0'), ('99', '3')], asks=[('101', '2')]), 2, 2.0)]
+
+
+def test_book_flush_snapshot_drops_pending(feed):
+    async def run():
+        book = OrderBook(BINANCE, 'BTC-USDT')
+        await feed.book_callback(L2_BOOK, book, 1.0, delta=delta(bids=[('100', '1')]), sequence_number=1)
+        await feed.book_callback(L2_BOOK, book, 2.0, sequence_number=2)
+        assert feed.updates == [('BTC-USDT', None, 2, 2.0)]
+        await feed._flush_books()
+
+    asyncio.run(run())
+    assert feed.updates == [('BTC-USDT', None, 2, 2.0)]
+
+
+def test_book_flush_one_update_per_symbol_per_interval(feed):
+    async def run():
+        btc = OrderBook(BINANCE, 'BTC-USDT')
+        eth = OrderBook(BINANCE, 'ETH-USDT')
+        for i in range(5):
+            await feed.book_callback(L2_BOOK, btc, float(i), delta=delta(bids=[(str(100 + i), '1')]), sequence_number=i)
+            await feed.book_callback(L2_BOOK, eth, float(i), delta=delta(asks=[(str(10 + i), '1')]), sequence_number=i)
+        await feed._flush_books()
+        assert sorted(update[0] for update in feed.updates) == ['BTC-USDT', 'ETH-USDT']
+
+        await feed.book_callback(L2_BOOK, btc, 5.0, delta=delta(bids=[('105', '1')]), sequence_number=5)
+        await feed._flush_books()
+
+    asyncio.run(run())
+    assert [update[0] for update in feed.updates[2:]] == ['BTC-USDT']
+    assert feed.updates[2][2] == 5
+
+
+def test_book_flusher_delivers_and_stops(feed):
+    feed.book_flush_interval = 0.01
+
+    async def run():
+        feed._book_flush_task = asyncio.create_task(feed._book_flusher())
+        task = feed._book_flush_task
+        await feed.book_callback(L2_BOOK, OrderBook(BINANCE, 'BTC-USDT'), 1.0, delta=delta(bids=[('100', '1')]), sequence_number=1)
+        for _ in range(100):
+            if feed.updates:
+                break
+            await asyncio.sleep(0.01)
+        feed.stop()
+        await asyncio.sleep(0)
+        assert task.cancelled()
+        assert feed._book_flush_task is None
+
+    asyncio.run(run())
+    assert feed.updates == [('BTC-USDT', delta(bids=[('100', '1')]), 1, 1.0)]
+
+
+def test_book_flush_shutdown_delivers_pending(feed):
+    async def run():
+        book = OrderBook(BINANCE, 'BTC-USDT')
+        await feed.book_callback(L2_BOOK, book, 1.0, delta=delta(bids=[('100', '1')]), sequence_number=1)
+        await feed.shutdown()
+
+    asyncio.run(run())
+    assert feed.updates == [('BTC-USDT', delta(bids=[('100', '1')]), 1, 1.0)]
+
+
+def test_book_flush_callback_error_does_not_stop_flush(feed):
+    async def failing(book, receipt_timestamp):
+        if book.symbol == 'BTC-USDT':
+            raise ValueError(book.symbol)
+        feed.updates.append((book.symbol, book.delta, book.sequence_number, receipt_timestamp))
+
+    feed.callbacks[L2_BOOK] = [failing]
+
+    async def run():
+        await feed.book_callback(L2_BOOK, OrderBook(BINANCE, 'BTC-USDT'), 1.0, delta=delta(bids=[('100', '1')]), sequence_number=1)
+        await feed.book_callback(L2_BOOK, OrderBook(BINANCE, 'ETH-USDT'), 1.0, delta=delta(asks=[('10', '1')]), sequence_number=1)
+        await feed._flush_books()
+
+    asyncio.run(run())
+    assert feed.updates == [('ETH-USDT', delta(asks=[('10', '1')]), 1, 1.0)]
+    assert feed._pending_book == {}